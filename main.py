@@ -1,15 +1,19 @@
 import asyncio
-import json
+import contextlib
 import logging
+import os
 import uuid
 from datetime import datetime, timezone
 
 import fastapi
 import pydantic
 import uvicorn
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 import model_registry
 import pubsub
+from model_services.base import dumps_for_log
 
 # Import model services here to ensure they are registered with the model registry
 from model_services.entity_linking import EntityLinkingModelService  # noqa:
@@ -19,17 +23,30 @@ from model_services.summarization import EntitySummarizationModelService  # noqa
 logging.basicConfig(level=logging.INFO)
 
 
-app = fastapi.FastAPI()
 pubsub_client = pubsub.PubSubClient()
 model_registry = model_registry.ModelRegistry(pubsub_client)
 
 
+@contextlib.asynccontextmanager
+async def lifespan(app: fastapi.FastAPI):
+    """Preload all models before serving requests, without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, model_registry.warmup)
+    yield
+    await model_registry.shutdown()
+
+
+app = fastapi.FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+# Summarization responses carry Wikipedia content for every entity, so compress larger payloads
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
 class PublishRequest(pydantic.BaseModel):
     """Request model for publishing messages to a topic."""
 
     topic: str
     payload: dict
-    ts: datetime = datetime.now(tz=timezone.utc)
+    ts: datetime = pydantic.Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 @app.get("/ping")
@@ -76,7 +93,8 @@ async def publish(request: PublishRequest):
     ts = request.ts
 
     logging.info(f"Publishing message with ID: {message_id} to topic: {topic} at {str(ts)}")
-    logging.info(json.dumps(payload))
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(dumps_for_log(payload))
 
     try:
         await pubsub_client.publish(topic=topic, message=payload)
@@ -95,7 +113,7 @@ async def publish(request: PublishRequest):
 
 
 @app.get("/{topic}/last_response")
-def last_response(topic: str):
+async def last_response(topic: str):
     """Get the last response for a specific topic."""
     logging.info(f"Fetching last response for topic: {topic}")
     try:
@@ -103,10 +121,26 @@ def last_response(topic: str):
         if not response:
             raise fastapi.HTTPException(status_code=404, detail="No response found")
         return response
+    except fastapi.HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Error fetching last response: {str(e)}")
         raise fastapi.HTTPException(status_code=500, detail="Internal Server Error")
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # Each worker is a separate process with its own models and Pub/Sub state, so the last
+    # responses served by `/{topic}/last_response` are only those seen by the same worker.
+    # Auto-reload only works with a single worker. "auto" picks uvloop and httptools when they
+    # are installed, which they are everywhere except for uvloop on Windows.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WEB_CONCURRENCY", 2)),
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+        reload=os.getenv("UVICORN_RELOAD", "0") == "1",
+    )
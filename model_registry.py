@@ -1,3 +1,4 @@
+import functools
 import logging
 from typing import Any, Callable, ClassVar, Type
 
@@ -28,9 +29,7 @@ class ModelRegistry:
         if not issubclass(model_service_class, base.ModelService):
             raise TypeError(f"{model_service_class.__name__} must inherit from ModelService")
 
-        # Create a temporary instance to get the name
-        temp_instance = model_service_class(pubsub_client=None)  # type: ignore
-        cls._model_services[temp_instance.name] = model_service_class
+        cls._model_services[model_service_class._NAME] = model_service_class
         return model_service_class
 
     @classmethod
@@ -52,11 +51,7 @@ class ModelRegistry:
             if not issubclass(source_service_class, base.ModelService):
                 raise TypeError(f"{source_service_class.__name__} must inherit from ModelService")
 
-            # Create temporary instances to get the names
-            source_instance = source_service_class(pubsub_client=None)  # type: ignore
-            target_instance = target_service_class(pubsub_client=None)  # type: ignore
-
-            cls._chains[source_instance.name] = target_instance.name
+            cls._chains[source_service_class._NAME] = target_service_class._NAME
             return source_service_class
 
         return decorator
@@ -118,6 +113,20 @@ class ModelRegistry:
 
             self._pubsub_client.register_topic(topic=service.trigger_topic, callback=callback)
 
+    def warmup(self) -> None:
+        """Preload the models of all model services.
+
+        This is a blocking call and should be run off the event loop.
+        """
+        for service in self._service_instances.values():
+            logging.info(f"Warming up model service: {service.name}")
+            service.warmup()
+
+    async def shutdown(self) -> None:
+        """Release the resources held by all model services."""
+        for service in self._service_instances.values():
+            await service.close()
+
     def get_model(self, model_name: str) -> base.ModelService:
         """Get a model service by name.
 
@@ -132,7 +141,7 @@ class ModelRegistry:
 
         return self._service_instances[model_name]
 
-    @property
+    @functools.cached_property
     def model_names(self) -> list[str]:
         """Get the names of all registered model services."""
         return list(self._model_services.keys())
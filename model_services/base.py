@@ -1,12 +1,27 @@
 import abc
 import json
 import logging
+import threading
+from typing import Any, ClassVar
 
+import orjson
 import pydantic
 
 import pubsub
 
 
+def dumps_for_log(obj: Any) -> str:
+    """Serialize an object to JSON for logging.
+
+    orjson is used for speed, falling back to the standard library for inputs it rejects
+    (e.g. integers larger than 64 bits), so that logging never fails a request.
+    """
+    try:
+        return orjson.dumps(obj).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, default=repr)
+
+
 class ModelService(abc.ABC):
     """Base class for a model service.
 
@@ -14,14 +29,23 @@ class ModelService(abc.ABC):
     as part of a Pub/Sub-triggered pipeline.
     """
 
+    # Name of the model service, read from the class by the registry without instantiating it
+    _NAME: ClassVar[str]
+    # Fields left out of the logged model input and output, in `model_dump(exclude=...)` format
+    _LOG_INPUT_EXCLUDE: ClassVar[Any] = None
+    _LOG_OUTPUT_EXCLUDE: ClassVar[Any] = None
+
     _model_name: str
     _trigger_topic: str
     _pubsub_client: pubsub.PubSubClient
+    _load_lock: threading.Lock
 
     def __init__(self, model_name: str, pubsub_client: pubsub.PubSubClient):
         self._model_name = model_name
         self._trigger_topic = f"{model_name}-trigger"
         self._pubsub_client = pubsub_client
+        # Guards lazy model loading, which may happen concurrently on executor threads
+        self._load_lock = threading.Lock()
 
     @abc.abstractmethod
     def get_input_schema(self) -> type[pydantic.BaseModel]:
@@ -41,6 +65,18 @@ class ModelService(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def warmup(self) -> None:
+        """Preload the model so that the first prediction does not pay the loading cost.
+
+        This is a blocking call and should be run off the event loop.
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release resources held by the model service, such as network sessions."""
+        pass
+
     @abc.abstractmethod
     async def _predict(self, model_input: pydantic.BaseModel) -> pydantic.BaseModel:
         """Perform inference on the model with the given input.
@@ -63,11 +99,17 @@ class ModelService(abc.ABC):
             dict: Model prediction output.
         """
         logging.info(f"Running prediction for model: {self._model_name}")
-        logging.info(f"Model input: {json.dumps(model_input)}")
+        # Serializing large payloads is expensive, so only do it if they will be logged
+        log_payloads = logging.getLogger().isEnabledFor(logging.INFO)
         schematized_input = self.get_input_schema()(**model_input)
+        if log_payloads:
+            logged_input = schematized_input.model_dump_json(exclude=self._LOG_INPUT_EXCLUDE)
+            logging.info(f"Model input: {logged_input}")
         schematized_output = await self._predict(schematized_input)
         raw_output = schematized_output.model_dump()
-        logging.info(f"Model output: {json.dumps(raw_output)}")
+        if log_payloads:
+            logged_output = schematized_output.model_dump_json(exclude=self._LOG_OUTPUT_EXCLUDE)
+            logging.info(f"Model output: {logged_output}")
         return raw_output
 
     @property
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+from typing import Callable, Generic, TypeVar
+
+InputT = TypeVar("InputT")
+OutputT = TypeVar("OutputT")
+
+
+def _closed_error() -> RuntimeError:
+    """Get the error set on inputs which were still waiting when the batcher was closed."""
+    return RuntimeError("Batcher closed before the input was processed")
+
+
+class MicroBatcher(Generic[InputT, OutputT]):
+    """Groups concurrently submitted inputs into batches for a blocking batch function.
+
+    Inputs are collected until `max_batch_size` of them are queued or `max_wait_ms` have
+    passed since the first one arrived. The batch function then runs on the default executor,
+    so concurrent requests share a single padded forward pass without blocking the event loop.
+    """
+
+    _process_batch: Callable[[list[InputT]], list[OutputT]]
+    _max_batch_size: int
+    _max_wait_seconds: float
+    _loop: asyncio.AbstractEventLoop | None
+    _queue: asyncio.Queue | None
+    _worker: asyncio.Task | None
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[InputT]], list[OutputT]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            process_batch: Blocking function mapping a list of inputs to a list of outputs
+                of the same length and order.
+            max_batch_size: Maximum number of inputs processed in one batch.
+            max_wait_ms: Maximum time to wait for a batch to fill up, in milliseconds.
+        """
+        self._process_batch = process_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_ms / 1000
+        self._loop = None
+        self._queue = None
+        self._worker = None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Start the batching task on the running event loop, if not already running."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def submit(self, item: InputT) -> OutputT:
+        """Submit an input and wait for its output.
+
+        Args:
+            item: The input to process.
+
+        Returns:
+            The output of the batch function for this input.
+        """
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((item, future))
+        return await future
+
+    async def _collect_batch(self, queue: asyncio.Queue) -> list[tuple[InputT, asyncio.Future]]:
+        """Wait for the next input and collect more until the batch is full or times out."""
+        loop = asyncio.get_running_loop()
+        batch = [await queue.get()]
+        deadline = loop.time() + self._max_wait_seconds
+        try:
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            self._fail(batch, _closed_error())
+            raise
+        return batch
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Process batches from the queue until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch(queue)
+            inputs = [item for item, _ in batch]
+            try:
+                outputs = await loop.run_in_executor(None, self._process_batch, inputs)
+                if len(outputs) != len(inputs):
+                    raise ValueError(
+                        f"Batch function returned {len(outputs)} outputs for {len(inputs)} inputs"
+                    )
+            except asyncio.CancelledError:
+                self._fail(batch, _closed_error())
+                raise
+            except Exception as e:
+                logging.error(f"Error processing batch of {len(inputs)} inputs: {str(e)}")
+                self._fail(batch, e)
+                continue
+
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
+
+    @staticmethod
+    def _fail(batch: list[tuple[InputT, asyncio.Future]], error: BaseException) -> None:
+        """Fail the futures of all inputs in a batch which are still waiting for an output."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def close(self) -> None:
+        """Stop the batching task and fail the inputs still waiting in the queue."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            # A task can only be awaited on the event loop it runs on
+            if self._loop is asyncio.get_running_loop():
+                try:
+                    await self._worker
+                except asyncio.CancelledError:
+                    pass
+
+        if self._queue is not None:
+            pending = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            self._fail(pending, _closed_error())
+
+        self._loop = None
+        self._queue = None
+        self._worker = None
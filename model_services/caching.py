@@ -0,0 +1,70 @@
+import hashlib
+import logging
+from typing import Any, Hashable
+
+import cachetools
+
+
+def content_key(text: str) -> str:
+    """Get a compact cache key identifying the content of a text."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+class InstrumentedCache:
+    """A thin wrapper around a `cachetools` cache which keeps hit/miss statistics.
+
+    Model services use it to memoize expensive lookups (network calls, model inference)
+    while still being able to report how effective the cache is.
+    """
+
+    _name: str
+    _cache: cachetools.Cache
+    _hits: int
+    _misses: int
+
+    def __init__(self, name: str, cache: cachetools.Cache):
+        self._name = name
+        self._cache = cache
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, recording a hit or a miss.
+
+        Args:
+            key: The cache key.
+            default: Value returned when the key is not cached.
+
+        Returns:
+            The cached value, or `default` if the key is not cached.
+        """
+        try:
+            value = self._cache[key]
+        except KeyError:
+            self._misses += 1
+            return default
+        self._hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value in the cache."""
+        self._cache[key] = value
+
+    def log_stats(self) -> None:
+        """Log the hit/miss statistics of the cache."""
+        total = self._hits + self._misses
+        hit_rate = self._hits / total if total else 0.0
+        logging.info(
+            f"Cache {self._name}: {self._hits} hits, {self._misses} misses "
+            f"(hit rate {hit_rate:.1%}, size {len(self._cache)}/{self._cache.maxsize})"
+        )
+
+    @property
+    def hits(self) -> int:
+        """Get the number of cache hits."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of cache misses."""
+        return self._misses
@@ -1,12 +1,16 @@
+import asyncio
 import logging
+import re
+from typing import Any, ClassVar, Iterable, NamedTuple
 
+import aiohttp
+import cachetools
 import pydantic
-import wikipedia
-from wikipedia.exceptions import DisambiguationError, PageError
 
 import pubsub
 from model_registry import ModelRegistry
 from model_services import base
+from model_services.caching import InstrumentedCache
 from model_services.schemas import (
     EntityLinkingInputSchema,
     EntityLinkingResultSchema,
@@ -14,17 +18,55 @@ from model_services.schemas import (
 )
 from model_services.summarization import EntitySummarizationModelService
 
+_NOT_CACHED = object()
+
+# First wiki link of a list item, e.g. "* [[Mercury (planet)|Mercury]], the planet"
+_DISAMBIGUATION_OPTION_PATTERN = re.compile(r"^\*+\s*'*\[\[([^\]|#]+)", re.MULTILINE)
+
+
+class WikipediaPageRecord(NamedTuple):
+    """The subset of a Wikipedia page kept in the lookup cache."""
+
+    title: str
+    url: str
+    content: str
+
 
 @ModelRegistry.register
 @ModelRegistry.chain_to(EntitySummarizationModelService)
 class EntityLinkingModelService(base.ModelService):
-    """A model service which provides entity linking capabilities."""
+    """A model service which provides entity linking capabilities.
 
-    _NAME: str = "entity-linking"
+    Entities are looked up with batched MediaWiki API queries, so linking a document costs
+    a constant number of round trips regardless of how many entities it contains.
+    """
+
+    _NAME: ClassVar[str] = "entity-linking"
+    _API_URL: str = "https://en.wikipedia.org/w/api.php"
+    _USER_AGENT: str = "huggingface-services/0.1 (entity linking)"
+    # Multiple extracts per query are capped at 20 by the TextExtracts API
+    _QUERY_BATCH_SIZE: int = 20
     _MAX_CONTENT_LENGTH: int = 1024
+    _CACHE_MAX_SIZE: int = 4096
+    _CACHE_TTL_SECONDS: int = 24 * 60 * 60
+    _LOG_OUTPUT_EXCLUDE: ClassVar[Any] = {"linked_entities": {"__all__": {"content"}}}
+    _ENTITY_ADAPTER: ClassVar[pydantic.TypeAdapter] = pydantic.TypeAdapter(WikipediaEntity)
+
+    _page_cache: InstrumentedCache
+    _disambiguation_cache: InstrumentedCache
+    _session: aiohttp.ClientSession | None
 
     def __init__(self, pubsub_client: pubsub.PubSubClient):
         super().__init__(model_name=self._NAME, pubsub_client=pubsub_client)
+        self._page_cache = InstrumentedCache(
+            "wikipedia-pages",
+            cachetools.TTLCache(maxsize=self._CACHE_MAX_SIZE, ttl=self._CACHE_TTL_SECONDS),
+        )
+        self._disambiguation_cache = InstrumentedCache(
+            "wikipedia-disambiguations",
+            cachetools.TTLCache(maxsize=self._CACHE_MAX_SIZE, ttl=self._CACHE_TTL_SECONDS),
+        )
+        self._session = None
 
     def get_input_schema(self) -> type[pydantic.BaseModel]:
         """Get the input schema for the model service."""
@@ -34,45 +76,199 @@ class EntityLinkingModelService(base.ModelService):
         """Get the output schema for the model service."""
         return EntityLinkingResultSchema
 
-    async def _predict(self, model_input: EntityLinkingInputSchema) -> EntityLinkingResultSchema:
+    def warmup(self) -> None:
+        """Nothing to preload, Wikipedia lookups do not use a model."""
+        pass
+
+    async def close(self) -> None:
+        """Close the shared HTTP session, if one was opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers={"User-Agent": self._USER_AGENT})
+        return self._session
+
+    async def _query(self, titles: list[str], **params: str) -> dict[str, Any]:
+        """Run a MediaWiki `action=query` request for the given titles.
+
+        Args:
+            titles: The page titles to query, at most `_QUERY_BATCH_SIZE` of them.
+            **params: Additional query parameters.
+
+        Returns:
+            dict: The `query` part of the API response.
+        """
+        data = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "redirects": "1",
+            "titles": "|".join(titles),
+            **params,
+        }
+        async with self._get_session().post(self._API_URL, data=data) as response:
+            response.raise_for_status()
+            body = await response.json()
+        return body.get("query", {})
+
+    @staticmethod
+    def _resolve_titles(titles: Iterable[str], query: dict[str, Any]) -> dict[str, dict]:
+        """Map the requested titles to their pages, following normalizations and redirects."""
+        pages = {page["title"]: page for page in query.get("pages", [])}
+        renames = {item["from"]: item["to"] for item in query.get("normalized", [])}
+        redirects = {item["from"]: item["to"] for item in query.get("redirects", [])}
+
+        resolved = {}
+        for title in titles:
+            final_title = renames.get(title, title)
+            final_title = redirects.get(final_title, final_title)
+            page = pages.get(final_title)
+            if page is not None and not page.get("missing") and not page.get("invalid"):
+                resolved[title] = page
+        return resolved
+
+    async def _fetch_pages(
+        self, titles: list[str]
+    ) -> tuple[dict[str, WikipediaPageRecord], set[str]]:
+        """Fetch page records for the given titles using batched queries.
 
-        linked_entities = []
-        for entity in model_input.entities:
-            entry = {"text": entity.text, "wikipedia_entries_found": False}
-
-            try:
-                page = wikipedia.page(entity.text, auto_suggest=False)
-                entry.update(
-                    {
-                        "wikipedia_entries_found": True,
-                        "title": page.title,
-                        "url": page.url,
-                        "content": page.content[: self._MAX_CONTENT_LENGTH] + "...",
-                    }
+        Args:
+            titles: The page titles to fetch.
+
+        Returns:
+            The page records keyed by requested title, and the set of requested titles which
+            are disambiguation pages.
+        """
+        batches = [
+            titles[i : i + self._QUERY_BATCH_SIZE]
+            for i in range(0, len(titles), self._QUERY_BATCH_SIZE)
+        ]
+        queries = await asyncio.gather(
+            *(
+                self._query(
+                    batch,
+                    prop="extracts|info|pageprops",
+                    inprop="url",
+                    ppprop="disambiguation",
+                    exintro="1",
+                    explaintext="1",
+                    exlimit="max",
                 )
-            except DisambiguationError as e:
-                logging.warning(f"DisambiguationError: {e}")
-                first_option = e.options[0]
-                page = wikipedia.page(first_option, auto_suggest=False)
-                entry.update(
-                    {
-                        "wikipedia_entries_found": True,
-                        "title": page.title,
-                        "url": page.url,
-                        "content": page.content[: self._MAX_CONTENT_LENGTH] + "...",
-                    }
+                for batch in batches
+            )
+        )
+
+        records = {}
+        disambiguations = set()
+        for batch, query in zip(batches, queries):
+            for title, page in self._resolve_titles(batch, query).items():
+                if "disambiguation" in page.get("pageprops", {}):
+                    disambiguations.add(title)
+                    continue
+                records[title] = WikipediaPageRecord(
+                    title=page["title"],
+                    url=page["fullurl"],
+                    content=page.get("extract", "")[: self._MAX_CONTENT_LENGTH] + "...",
                 )
+        return records, disambiguations
+
+    async def _resolve_disambiguations(self, titles: list[str]) -> dict[str, str]:
+        """Resolve disambiguation pages to their first listed option.
+
+        Args:
+            titles: The disambiguation page titles.
+
+        Returns:
+            dict: The first option title keyed by disambiguation page title.
+        """
+        batches = [
+            titles[i : i + self._QUERY_BATCH_SIZE]
+            for i in range(0, len(titles), self._QUERY_BATCH_SIZE)
+        ]
+        queries = await asyncio.gather(
+            *(
+                self._query(batch, prop="revisions", rvprop="content", rvslots="main")
+                for batch in batches
+            )
+        )
+
+        options = {}
+        for batch, query in zip(batches, queries):
+            for title, page in self._resolve_titles(batch, query).items():
+                revisions = page.get("revisions") or [{}]
+                wikitext = revisions[0].get("slots", {}).get("main", {}).get("content", "")
+                match = _DISAMBIGUATION_OPTION_PATTERN.search(wikitext)
+                if match:
+                    logging.warning(f"Resolved disambiguation page {title} to {match.group(1)}")
+                    options[title] = match.group(1).strip()
+        return options
+
+    async def _fetch_pages_cached(self, texts: list[str]) -> dict[str, WikipediaPageRecord | None]:
+        """Fetch the Wikipedia pages for entities, using the page cache when possible.
+
+        Disambiguation pages are resolved to their first option. The resolution is cached
+        separately so that a page cache eviction does not trigger the extra lookup again.
+
+        Args:
+            texts: The entity texts to look up.
+
+        Returns:
+            dict: The page records keyed by entity text, None if no page exists for the entity.
+        """
+        records = {}
+        titles = {}
+        for text in texts:
+            record = self._page_cache.get(text, _NOT_CACHED)
+            if record is _NOT_CACHED:
+                titles[text] = self._disambiguation_cache.get(text, text)
+            else:
+                records[text] = record
+
+        if not titles:
+            return records
+
+        try:
+            pages, disambiguations = await self._fetch_pages(list(set(titles.values())))
+            if disambiguations:
+                options = await self._resolve_disambiguations(list(disambiguations))
+                for text, title in titles.items():
+                    if title in options:
+                        titles[text] = options[title]
+                        self._disambiguation_cache.set(text, options[title])
+                option_pages, _ = await self._fetch_pages(list(set(options.values())))
+                pages.update(option_pages)
+        except Exception as e:
+            # Leave the entities uncached so that the lookup is retried on the next request
+            logging.error(f"Exception: {e}")
+            return records
+
+        for text, title in titles.items():
+            records[text] = pages.get(title)
+            self._page_cache.set(text, records[text])
+        return records
+
+    async def _predict(self, model_input: EntityLinkingInputSchema) -> EntityLinkingResultSchema:
+        """Link all entities with batched Wikipedia lookups."""
+        # The same entity often appears many times in a document, so look up each text once
+        unique_texts = list(dict.fromkeys(entity.text for entity in model_input.entities))
+        records = await self._fetch_pages_cached(unique_texts)
 
-            except PageError as e:
-                logging.error(f"PageError: {e}")
-                entry["wikipedia_entries_found"] = False
+        linked_by_text = {}
+        for text in unique_texts:
+            entry = {"text": text, "wikipedia_entries_found": False}
+            record = records.get(text)
+            if record is not None:
+                entry.update({"wikipedia_entries_found": True, **record._asdict()})
+            linked_by_text[text] = self._ENTITY_ADAPTER.validate_python(entry)
 
-            except Exception as e:
-                logging.error(f"Exception: {e}")
-                entry["wikipedia_entries_found"] = False
+        linked_entities = [linked_by_text[entity.text] for entity in model_input.entities]
 
-            entity_adapter = pydantic.TypeAdapter(WikipediaEntity)
-            linked_entities.append(entity_adapter.validate_python(entry))
+        self._page_cache.log_stats()
+        self._disambiguation_cache.log_stats()
 
         return EntityLinkingResultSchema(
             id=model_input.id,
@@ -0,0 +1,86 @@
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    import optimum.onnxruntime as ort
+    from filelock import FileLock
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    ort = None
+
+_ONNX_CACHE_DIR = Path(
+    os.getenv("ONNX_CACHE_DIR", "~/.cache/huggingface-services/onnx")
+).expanduser()
+
+
+def _export_int8_model(model_class: Any, model_name: str, save_dir: Path, per_channel: bool):
+    """Export a Hugging Face model to ONNX and apply dynamic INT8 quantization to it.
+
+    Every ONNX file of the export (e.g. encoder and decoder of seq2seq models) is quantized
+    under its original file name, so the result loads like a regular ONNX Runtime model.
+    The export is staged in a private temporary directory and only moved to `save_dir` once
+    complete, so a failed export never leaves a partial model behind.
+    """
+    with tempfile.TemporaryDirectory(dir=save_dir.parent) as work_dir:
+        export_dir = Path(work_dir) / "fp32"
+        staging_dir = Path(work_dir) / "int8"
+
+        model = model_class.from_pretrained(model_name, export=True)
+        model.save_pretrained(export_dir)
+
+        quantization_config = AutoQuantizationConfig.avx512_vnni(
+            is_static=False, per_channel=per_channel
+        )
+        for onnx_file in sorted(export_dir.glob("*.onnx")):
+            quantizer = ort.ORTQuantizer.from_pretrained(export_dir, file_name=onnx_file.name)
+            quantizer.quantize(
+                save_dir=staging_dir, quantization_config=quantization_config, file_suffix=None
+            )
+
+        for config_file in export_dir.glob("*.json"):
+            if not (staging_dir / config_file.name).exists():
+                shutil.copy(config_file, staging_dir)
+
+        staging_dir.rename(save_dir)
+
+
+def load_int8_ort_model(model_class_name: str, model_name: str, per_channel: bool = False) -> Any:
+    """Load a dynamically INT8-quantized ONNX Runtime version of a Hugging Face model.
+
+    The quantized model is exported on first use and cached on disk under `ONNX_CACHE_DIR`.
+    The export holds a file lock, so concurrently starting workers export it only once.
+
+    Args:
+        model_class_name: Name of the `optimum.onnxruntime` model class, e.g.
+            "ORTModelForSeq2SeqLM".
+        model_name: The Hugging Face model name.
+        per_channel: Whether to quantize weights per channel instead of per tensor.
+
+    Returns:
+        The quantized model, or None if `optimum[onnxruntime]` is not installed or the
+        export fails, in which case callers should fall back to PyTorch.
+    """
+    if ort is None:
+        logging.info("optimum[onnxruntime] is not installed, skipping INT8 quantization.")
+        return None
+
+    model_class = getattr(ort, model_class_name)
+    save_dir = _ONNX_CACHE_DIR / f"{model_name.replace('/', '--')}-int8"
+    try:
+        if not save_dir.exists():
+            save_dir.parent.mkdir(parents=True, exist_ok=True)
+            with FileLock(f"{save_dir}.lock"):
+                # Another worker may have finished the export while we waited for the lock
+                if not save_dir.exists():
+                    logging.info(
+                        f"Exporting INT8-quantized ONNX model for {model_name} to {save_dir}"
+                    )
+                    _export_int8_model(model_class, model_name, save_dir, per_channel)
+        return model_class.from_pretrained(save_dir, provider="CPUExecutionProvider")
+    except Exception as e:
+        logging.warning(f"Failed to load INT8-quantized model for {model_name}: {str(e)}")
+        return None
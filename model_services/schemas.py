@@ -1,5 +1,5 @@
 import uuid
-from typing import Literal
+from typing import Annotated, Literal
 
 import pydantic
 
@@ -34,7 +34,17 @@ class WikipediaEntityNotFound(pydantic.BaseModel):
     wikipedia_entries_found: Literal[False]
 
 
-WikipediaEntity = WikipediaEntityFound | WikipediaEntityNotFound
+# Discriminating on `wikipedia_entries_found` lets Pydantic pick the variant directly instead
+# of trying each one in turn
+WikipediaEntity = Annotated[
+    WikipediaEntityFound | WikipediaEntityNotFound,
+    pydantic.Field(discriminator="wikipedia_entries_found"),
+]
+
+SummarizedWikipediaEntityOrNotFound = Annotated[
+    SummarizedWikipediaEntity | WikipediaEntityNotFound,
+    pydantic.Field(discriminator="wikipedia_entries_found"),
+]
 
 
 class EntityRecognitionInputSchema(pydantic.BaseModel):
@@ -77,4 +87,4 @@ class EntitySummarizationResultSchema(pydantic.BaseModel):
 
     id: str
     text: str
-    summarized_entities: list[SummarizedWikipediaEntity | WikipediaEntityNotFound]
+    summarized_entities: list[SummarizedWikipediaEntityOrNotFound]
@@ -1,15 +1,30 @@
-import json
+import collections
+import itertools
 import logging
 from typing import Any, Callable
 
+import orjson
+
 
 class PubSubClient:
+    """An in-memory Pub/Sub client.
+
+    The client keeps the last response of up to `_MAX_LAST_RESPONSES` topics, evicting the
+    least recently updated ones. State is local to the process, so with multiple uvicorn
+    workers each worker only sees its own responses; sharing them requires an external store
+    such as Redis.
+    """
+
+    _MAX_LAST_RESPONSES: int = 256
+
     _message_queues: dict[str, Callable[[dict], Any] | None]
-    _last_responses: dict[str, dict]
+    _last_responses: collections.OrderedDict[str, tuple[int, dict]]
+    _publish_sequence: itertools.count
 
     def __init__(self):
         self._message_queues = {}
-        self._last_responses = {}
+        self._last_responses = collections.OrderedDict()
+        self._publish_sequence = itertools.count()
 
     def register_topic(self, topic: str, callback: Callable[[dict], Any]) -> None:
         """Register a callback for a specific topic."""
@@ -32,12 +47,30 @@ class PubSubClient:
         callback = self._message_queues[topic]
         if callback is None:
             raise ValueError(f"No callback registered for topic {topic}.")
+        sequence = next(self._publish_sequence)
         response = await callback(message)
         logging.info(f"Message {message_id} published to topic {topic}")
-        logging.info(json.dumps(response))
-        self._last_responses[topic] = response
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(orjson.dumps(response).decode())
+        self._store_last_response(topic, sequence, response)
         return response
 
+    def _store_last_response(self, topic: str, sequence: int, response: dict) -> None:
+        """Store the last response for a topic.
+
+        Concurrent publishes to the same topic may finish out of order, so a response is only
+        stored if no later publish has stored one already. This does not await, so it runs
+        atomically with respect to other coroutines and needs no lock.
+        """
+        stored = self._last_responses.get(topic)
+        if stored is not None and stored[0] > sequence:
+            return
+        self._last_responses[topic] = (sequence, response)
+        self._last_responses.move_to_end(topic)
+        while len(self._last_responses) > self._MAX_LAST_RESPONSES:
+            self._last_responses.popitem(last=False)
+
     def get_last_response(self, topic: str) -> dict:
         """Get the last response for a specific topic."""
-        return self._last_responses.get(topic, {})
+        stored = self._last_responses.get(topic)
+        return stored[1] if stored is not None else {}
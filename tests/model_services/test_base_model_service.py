@@ -0,0 +1,14 @@
+import json
+
+from model_services.base import dumps_for_log
+
+
+def test_dumps_for_log_serializes_json():
+    assert json.loads(dumps_for_log({"text": "Obama", "entities": [1, 2]})) == {
+        "text": "Obama",
+        "entities": [1, 2],
+    }
+
+
+def test_dumps_for_log_falls_back_for_integers_beyond_64_bits():
+    assert json.loads(dumps_for_log({"big": 2**70})) == {"big": 2**70}
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from model_services.batcher import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_groups_concurrent_inputs():
+    batches = []
+
+    def process_batch(items: list[int]) -> list[int]:
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(process_batch, max_batch_size=4, max_wait_ms=50)
+    outputs = await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+
+    assert outputs == [0, 2, 4, 6, 8, 10]
+    assert batches == [[0, 1, 2, 3], [4, 5]]
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_propagates_errors():
+    def process_batch(items: list[int]) -> list[int]:
+        raise RuntimeError("boom")
+
+    batcher = MicroBatcher(process_batch, max_batch_size=4, max_wait_ms=1)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await batcher.submit(1)
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_fails_all_inputs_when_outputs_are_missing():
+    batcher = MicroBatcher(lambda items: items[:1], max_batch_size=4, max_wait_ms=50)
+    submitted = asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+    results = await asyncio.wait_for(submitted, timeout=1)
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_close_fails_waiting_inputs():
+    batcher = MicroBatcher(lambda items: items, max_batch_size=4, max_wait_ms=1000)
+    submitted = asyncio.gather(*(batcher.submit(i) for i in range(2)), return_exceptions=True)
+    await asyncio.sleep(0.01)
+
+    await batcher.close()
+    results = await asyncio.wait_for(submitted, timeout=1)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await batcher.submit(3) == 3
@@ -2,6 +2,7 @@ import pytest
 
 import model_registry
 import pubsub
+from model_services.entity_linking import EntityLinkingModelService
 from model_services.entity_recognition import EntityRecognitionModelService
 
 
@@ -19,3 +20,131 @@ async def test_ner_model_predicts_entities():
     assert output["id"] == "doc1"
     assert any(e["label"] == "PER" for e in output["entities"])
     assert any("Barack Obama" in e["text"] for e in output["entities"])
+
+
+_DISAMBIGUATION_WIKITEXT = (
+    "'''Mercury''' may refer to:\n"
+    "* [[Mercury (planet)|Mercury]], the closest planet to the Sun\n"
+    "* [[Mercury (element)]], a chemical element\n"
+)
+_FOUND_TITLES = {"Barack Obama", "Mercury (planet)"} | {f"Entity {i}" for i in range(25)}
+
+
+@pytest.fixture
+def mediawiki_calls(monkeypatch):
+    """Stub MediaWiki API queries with canned responses and record the calls."""
+    calls = []
+
+    async def fake_query(self, titles, **params):
+        calls.append((list(titles), params["prop"]))
+        if params["prop"] == "revisions":
+            return {
+                "pages": [
+                    {
+                        "title": title,
+                        "revisions": [{"slots": {"main": {"content": _DISAMBIGUATION_WIKITEXT}}}],
+                    }
+                    for title in titles
+                ]
+            }
+
+        query = {"normalized": [], "redirects": [], "pages": []}
+        for title in titles:
+            if title == "barack obama":
+                query["normalized"].append({"from": "barack obama", "to": "Barack obama"})
+                query["redirects"].append({"from": "Barack obama", "to": "Barack Obama"})
+                title = "Barack Obama"
+            if title == "Mercury":
+                page = {"title": title, "fullurl": "url", "pageprops": {"disambiguation": ""}}
+            elif title in _FOUND_TITLES:
+                page = {
+                    "title": title,
+                    "fullurl": f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}",
+                    "extract": f"{title} article.",
+                }
+            else:
+                page = {"title": title, "missing": True}
+            query["pages"].append(page)
+        return query
+
+    monkeypatch.setattr(EntityLinkingModelService, "_query", fake_query)
+    return calls
+
+
+def _linking_input(*texts):
+    return {
+        "id": "doc1",
+        "text": " ".join(texts),
+        "entities": [{"text": text, "label": "MISC"} for text in texts],
+    }
+
+
+@pytest.mark.asyncio
+async def test_entity_linking_follows_normalization_and_redirects(mediawiki_calls):
+    service = EntityLinkingModelService(pubsub_client=pubsub.PubSubClient())
+    output = await service.predict(_linking_input("barack obama"))
+
+    entity = output["linked_entities"][0]
+    assert entity["wikipedia_entries_found"]
+    assert entity["text"] == "barack obama"
+    assert entity["title"] == "Barack Obama"
+    assert entity["url"] == "https://en.wikipedia.org/wiki/Barack_Obama"
+    assert entity["content"] == "Barack Obama article...."
+
+
+@pytest.mark.asyncio
+async def test_entity_linking_marks_missing_pages_not_found(mediawiki_calls):
+    service = EntityLinkingModelService(pubsub_client=pubsub.PubSubClient())
+    output = await service.predict(_linking_input("Xyzzy"))
+
+    assert output["linked_entities"] == [{"text": "Xyzzy", "wikipedia_entries_found": False}]
+
+
+@pytest.mark.asyncio
+async def test_entity_linking_resolves_disambiguation_to_first_option(mediawiki_calls):
+    service = EntityLinkingModelService(pubsub_client=pubsub.PubSubClient())
+    output = await service.predict(_linking_input("Mercury"))
+
+    entity = output["linked_entities"][0]
+    assert entity["wikipedia_entries_found"]
+    assert entity["title"] == "Mercury (planet)"
+    assert [prop for _, prop in mediawiki_calls] == [
+        "extracts|info|pageprops",
+        "revisions",
+        "extracts|info|pageprops",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_entity_linking_batches_more_than_20_titles(mediawiki_calls):
+    service = EntityLinkingModelService(pubsub_client=pubsub.PubSubClient())
+    texts = [f"Entity {i}" for i in range(25)]
+    output = await service.predict(_linking_input(*texts))
+
+    assert [entity["title"] for entity in output["linked_entities"]] == texts
+    assert sorted(len(titles) for titles, _ in mediawiki_calls) == [5, 20]
+
+
+@pytest.mark.asyncio
+async def test_entity_linking_serves_repeated_lookups_from_cache(mediawiki_calls):
+    service = EntityLinkingModelService(pubsub_client=pubsub.PubSubClient())
+    model_input = _linking_input("barack obama", "Mercury", "Xyzzy")
+
+    first_output = await service.predict(model_input)
+    calls_after_first_request = len(mediawiki_calls)
+    second_output = await service.predict(model_input)
+
+    assert second_output == first_output
+    assert len(mediawiki_calls) == calls_after_first_request
+
+
+@pytest.mark.asyncio
+async def test_entity_linking_close_releases_http_session():
+    service = EntityLinkingModelService(pubsub_client=pubsub.PubSubClient())
+    session = service._get_session()
+
+    await service.close()
+
+    assert session.closed
+    assert service._get_session() is not session
+    await service.close()
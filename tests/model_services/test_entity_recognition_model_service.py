@@ -0,0 +1,31 @@
+import pytest
+
+import pubsub
+from model_services.entity_recognition import EntityRecognitionModelService
+
+
+@pytest.fixture
+def recognized_batches(monkeypatch):
+    """Stub the NER pipeline with canned results and record its batches."""
+    batches = []
+
+    def fake_recognize_batch(self, texts):
+        batches.append(list(texts))
+        return [[{"word": "Barack Obama", "entity_group": "PER"}] for _ in texts]
+
+    monkeypatch.setattr(EntityRecognitionModelService, "_recognize_batch", fake_recognize_batch)
+    return batches
+
+
+@pytest.mark.asyncio
+async def test_ner_serves_repeated_text_from_cache(recognized_batches):
+    service = EntityRecognitionModelService(pubsub_client=pubsub.PubSubClient())
+    text = "Barack Obama visited Microsoft headquarters in Seattle."
+
+    first_output = await service.predict({"id": "doc1", "text": text})
+    second_output = await service.predict({"id": "doc2", "text": text})
+
+    assert recognized_batches == [[text]]
+    assert second_output["id"] == "doc2"
+    assert second_output["entities"] == first_output["entities"]
+    assert second_output["entities"] == [{"text": "Barack Obama", "label": "PER"}]
@@ -0,0 +1,116 @@
+import logging
+
+import pytest
+
+import pubsub
+from model_services.summarization import EntitySummarizationModelService
+
+
+@pytest.fixture
+def summarized_batches(monkeypatch):
+    """Stub the summarization model with a deterministic one and record its batches."""
+    batches = []
+
+    def fake_summarize_texts(self, texts):
+        batches.append(list(texts))
+        return [f"Summary of {text}" for text in texts]
+
+    monkeypatch.setattr(EntitySummarizationModelService, "_summarize_texts", fake_summarize_texts)
+    return batches
+
+
+def _found(text, content):
+    return {
+        "text": text,
+        "wikipedia_entries_found": True,
+        "title": text,
+        "url": f"https://en.wikipedia.org/wiki/{text}",
+        "content": content,
+    }
+
+
+def _not_found(text):
+    return {"text": text, "wikipedia_entries_found": False}
+
+
+def _summarization_input(*entities):
+    return {"id": "doc1", "text": "Some text.", "linked_entities": list(entities)}
+
+
+@pytest.mark.asyncio
+async def test_summarization_aligns_summaries_with_interleaved_entities(summarized_batches):
+    service = EntitySummarizationModelService(pubsub_client=pubsub.PubSubClient())
+    output = await service.predict(
+        _summarization_input(
+            _not_found("Xyzzy"),
+            _found("Obama", "Obama content."),
+            _not_found("Plugh"),
+            _found("Seattle", "Seattle content."),
+            _found("Microsoft", "Microsoft content."),
+            _not_found("Frobozz"),
+        )
+    )
+
+    entities = output["summarized_entities"]
+    assert [entity["text"] for entity in entities] == [
+        "Xyzzy",
+        "Obama",
+        "Plugh",
+        "Seattle",
+        "Microsoft",
+        "Frobozz",
+    ]
+    assert [entity.get("summary") for entity in entities] == [
+        None,
+        "Summary of Obama content.",
+        None,
+        "Summary of Seattle content.",
+        "Summary of Microsoft content.",
+        None,
+    ]
+    assert entities[2] == _not_found("Plugh")
+    assert sorted(text for batch in summarized_batches for text in batch) == [
+        "Microsoft content.",
+        "Obama content.",
+        "Seattle content.",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_summarization_serves_repeated_content_from_cache(summarized_batches):
+    service = EntitySummarizationModelService(pubsub_client=pubsub.PubSubClient())
+    model_input = _summarization_input(
+        _found("Obama", "Obama content."),
+        _found("Barack Obama", "Obama content."),
+        _not_found("Xyzzy"),
+    )
+
+    first_output = await service.predict(model_input)
+    batches_after_first_request = list(summarized_batches)
+    second_output = await service.predict(model_input)
+
+    assert second_output == first_output
+    assert [entity.get("summary") for entity in first_output["summarized_entities"]] == [
+        "Summary of Obama content.",
+        "Summary of Obama content.",
+        None,
+    ]
+    assert batches_after_first_request == [["Obama content."]]
+    assert summarized_batches == batches_after_first_request
+
+
+@pytest.mark.asyncio
+async def test_summarization_leaves_content_out_of_logged_payloads(summarized_batches, caplog):
+    service = EntitySummarizationModelService(pubsub_client=pubsub.PubSubClient())
+
+    with caplog.at_level(logging.INFO):
+        await service.predict(_summarization_input(_found("Obama", "Obama content.")))
+
+    payload_logs = [
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith(("Model input:", "Model output:"))
+    ]
+    assert len(payload_logs) == 2
+    assert all('"content"' not in message for message in payload_logs)
+    assert "Summary of Obama content." in payload_logs[1]
@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+import pubsub
+
+
+async def _delayed_echo(message: dict) -> dict:
+    await asyncio.sleep(message["delay"])
+    return message
+
+
+@pytest.mark.asyncio
+async def test_last_response_is_not_overwritten_by_earlier_publish():
+    pubsub_client = pubsub.PubSubClient()
+    pubsub_client.register_topic(topic="topic", callback=_delayed_echo)
+
+    # The first publish starts earlier but finishes after the second one
+    await asyncio.gather(
+        pubsub_client.publish(topic="topic", message={"n": 1, "delay": 0.05}),
+        pubsub_client.publish(topic="topic", message={"n": 2, "delay": 0.0}),
+    )
+
+    assert pubsub_client.get_last_response("topic")["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_last_responses_evict_least_recently_updated_topic():
+    pubsub_client = pubsub.PubSubClient()
+    topics = [f"topic-{i}" for i in range(pubsub.PubSubClient._MAX_LAST_RESPONSES + 1)]
+    for topic in topics:
+        pubsub_client.register_topic(topic=topic, callback=_delayed_echo)
+        await pubsub_client.publish(topic=topic, message={"topic": topic, "delay": 0.0})
+
+    assert pubsub_client.get_last_response(topics[0]) == {}
+    assert pubsub_client.get_last_response(topics[1])["topic"] == topics[1]
+    assert pubsub_client.get_last_response(topics[-1])["topic"] == topics[-1]